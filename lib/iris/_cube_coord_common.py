@@ -6,6 +6,7 @@
 
 
 from collections import namedtuple
+from functools import lru_cache
 import re
 
 import cf_units
@@ -74,25 +75,28 @@ def get_valid_standard_name(name):
 
 
 class LimitedAttributeDict(dict):
-    _forbidden_keys = (
-        "standard_name",
-        "long_name",
-        "units",
-        "bounds",
-        "axis",
-        "calendar",
-        "leap_month",
-        "leap_year",
-        "month_lengths",
-        "coordinates",
-        "grid_mapping",
-        "climatology",
-        "cell_methods",
-        "formula_terms",
-        "compress",
-        "add_offset",
-        "scale_factor",
-        "_FillValue",
+    # A frozenset, as every key set or updated is tested for membership.
+    _forbidden_keys = frozenset(
+        (
+            "standard_name",
+            "long_name",
+            "units",
+            "bounds",
+            "axis",
+            "calendar",
+            "leap_month",
+            "leap_year",
+            "month_lengths",
+            "coordinates",
+            "grid_mapping",
+            "climatology",
+            "cell_methods",
+            "formula_terms",
+            "compress",
+            "add_offset",
+            "scale_factor",
+            "_FillValue",
+        )
     )
 
     def __init__(self, *args, **kwargs):
@@ -104,7 +108,8 @@ class LimitedAttributeDict(dict):
 
     def __eq__(self, other):
         # Extend equality to allow for NumPy arrays.
-        match = set(self.keys()) == set(other.keys())
+        # Key views compare as sets, without building intermediate sets.
+        match = self.keys() == other.keys()
         if match:
             for key, value in self.items():
                 match = value == other[key]
@@ -142,6 +147,21 @@ class LimitedAttributeDict(dict):
         dict.update(self, other, **kwargs)
 
 
+@lru_cache(maxsize=4096)
+def _token_name(check, standard_name, long_name, var_name, stash, default):
+    # Resolve CFVariableMixin.name(token=True) from its component strings,
+    # using the "check" token function of the calling class. The result
+    # depends only on these hashable values, so it is memoized to avoid
+    # repeatedly validating the same names.
+    return (
+        check(standard_name)
+        or check(long_name)
+        or check(var_name)
+        or check(stash)
+        or check(default)
+    )
+
+
 class CFVariableMixin:
 
     _DEFAULT_NAME = "unknown"  # the name default string
@@ -189,22 +209,34 @@ class CFVariableMixin:
 
         """
 
-        def _check(item):
-            return self.token(item) if token else item
-
         default = self._DEFAULT_NAME if default is None else default
 
-        result = (
-            _check(self.standard_name)
-            or _check(self.long_name)
-            or _check(self.var_name)
-            or _check(str(self.attributes.get("STASH", "")))
-            or _check(default)
-        )
-
-        if token and result is None:
-            emsg = "Cannot retrieve a valid name token from {!r}"
-            raise ValueError(emsg.format(self))
+        stash = self.attributes.get("STASH")
+        if stash is not None:
+            stash = str(stash)
+
+        if token:
+            # Note that "token" is a static method, so this honours any
+            # subclass override without binding the instance into the key.
+            result = _token_name(
+                type(self).token,
+                self.standard_name,
+                self.long_name,
+                self.var_name,
+                stash,
+                default,
+            )
+            if result is None:
+                emsg = "Cannot retrieve a valid name token from {!r}"
+                raise ValueError(emsg.format(self))
+        else:
+            result = (
+                self.standard_name
+                or self.long_name
+                or self.var_name
+                or stash
+                or default
+            )
 
         return result
 
@@ -1844,7 +1844,8 @@ class ProtoCube:
 
         factory_defns = []
         for factory in sorted(
-            cube.aux_factories, key=lambda factory: factory._as_defn()
+            cube.aux_factories,
+            key=lambda factory: factory._as_defn()._sort_key(),
         ):
             dependency_defns = []
             dependencies = factory.dependencies
@@ -928,26 +928,33 @@ class CoordDefn(
         """
         return self.standard_name or self.long_name or self.var_name or default
 
+    def __hash__(self):
+        # The attributes and coord_system are unhashable, and units compare
+        # equal to their string form (which hashes differently), so only
+        # the names, which equal definitions share, are hashed.
+        # CellMeasureDefn, _DMDefn and CubeMetadata hash in the same way.
+        return hash((self.standard_name, self.long_name, self.var_name))
+
     def __lt__(self, other):
         if not isinstance(other, CoordDefn):
             return NotImplemented
 
-        def _sort_key(defn):
-            # Emulate Python 2 behaviour with None
-            return (
-                defn.standard_name is not None,
-                defn.standard_name,
-                defn.long_name is not None,
-                defn.long_name,
-                defn.var_name is not None,
-                defn.var_name,
-                defn.units is not None,
-                defn.units,
-                defn.coord_system is not None,
-                defn.coord_system,
-            )
+        return self._sort_key() < other._sort_key()
 
-        return _sort_key(self) < _sort_key(other)
+    def _sort_key(self):
+        # Emulate Python 2 behaviour with None
+        return (
+            self.standard_name is not None,
+            self.standard_name,
+            self.long_name is not None,
+            self.long_name,
+            self.var_name is not None,
+            self.var_name,
+            self.units is not None,
+            self.units,
+            self.coord_system is not None,
+            self.coord_system,
+        )
 
 
 class CellMeasureDefn(
@@ -982,26 +989,31 @@ class CellMeasureDefn(
         """
         return self.standard_name or self.long_name or self.var_name or default
 
+    def __hash__(self):
+        return hash(
+            (self.standard_name, self.long_name, self.var_name, self.measure)
+        )
+
     def __lt__(self, other):
         if not isinstance(other, CellMeasureDefn):
             return NotImplemented
 
-        def _sort_key(defn):
-            # Emulate Python 2 behaviour with None
-            return (
-                defn.standard_name is not None,
-                defn.standard_name,
-                defn.long_name is not None,
-                defn.long_name,
-                defn.var_name is not None,
-                defn.var_name,
-                defn.units is not None,
-                defn.units,
-                defn.measure is not None,
-                defn.measure,
-            )
+        return self._sort_key() < other._sort_key()
 
-        return _sort_key(self) < _sort_key(other)
+    def _sort_key(self):
+        # Emulate Python 2 behaviour with None
+        return (
+            self.standard_name is not None,
+            self.standard_name,
+            self.long_name is not None,
+            self.long_name,
+            self.var_name is not None,
+            self.var_name,
+            self.units is not None,
+            self.units,
+            self.measure is not None,
+            self.measure,
+        )
 
 
 class _DMDefn(
@@ -1029,24 +1041,27 @@ class _DMDefn(
         """
         return self.standard_name or self.long_name or self.var_name or default
 
+    def __hash__(self):
+        return hash((self.standard_name, self.long_name, self.var_name))
+
     def __lt__(self, other):
         if not isinstance(other, _DMDefn):
             return NotImplemented
 
-        def _sort_key(defn):
-            # Emulate Python 2 behaviour with None
-            return (
-                defn.standard_name is not None,
-                defn.standard_name,
-                defn.long_name is not None,
-                defn.long_name,
-                defn.var_name is not None,
-                defn.var_name,
-                defn.units is not None,
-                defn.units,
-            )
+        return self._sort_key() < other._sort_key()
 
-        return _sort_key(self) < _sort_key(other)
+    def _sort_key(self):
+        # Emulate Python 2 behaviour with None
+        return (
+            self.standard_name is not None,
+            self.standard_name,
+            self.long_name is not None,
+            self.long_name,
+            self.var_name is not None,
+            self.var_name,
+            self.units is not None,
+            self.units,
+        )
 
 
 class CoordExtent(
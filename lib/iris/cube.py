@@ -80,6 +80,13 @@ class CubeMetadata(
         """
         return self.standard_name or self.long_name or self.var_name or default
 
+    def __hash__(self):
+        return hash((self.standard_name, self.long_name, self.var_name))
+
+
+# Fetches all of the CubeMetadata fields from an object in a single call.
+_get_cube_metadata = operator.attrgetter(*CubeMetadata._fields)
+
 
 # The XML namespace to use for CubeML documents
 XML_NAMESPACE_URI = "urn:x-iris:cubeml-0.2"
@@ -941,32 +948,27 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
            :class:`CubeMetadata`.
 
         """
-        return CubeMetadata(
-            self.standard_name,
-            self.long_name,
-            self.var_name,
-            self.units,
-            self.attributes,
-            self.cell_methods,
-        )
+        return CubeMetadata._make(_get_cube_metadata(self))
 
     @metadata.setter
     def metadata(self, value):
-        try:
-            value = CubeMetadata(**value)
-        except TypeError:
+        if not isinstance(value, CubeMetadata):
             try:
-                value = CubeMetadata(*value)
+                value = CubeMetadata(**value)
             except TypeError:
-                missing_attrs = [
-                    field
-                    for field in CubeMetadata._fields
-                    if not hasattr(value, field)
-                ]
-                if missing_attrs:
-                    raise TypeError("Invalid/incomplete metadata")
-        for name in CubeMetadata._fields:
-            setattr(self, name, getattr(value, name))
+                try:
+                    value = CubeMetadata(*value)
+                except TypeError:
+                    missing_attrs = [
+                        field
+                        for field in CubeMetadata._fields
+                        if not hasattr(value, field)
+                    ]
+                    if missing_attrs:
+                        raise TypeError("Invalid/incomplete metadata")
+        values = _get_cube_metadata(value)
+        for name, field_value in zip(CubeMetadata._fields, values):
+            setattr(self, name, field_value)
 
     def is_compatible(self, other, ignore=None):
         """
@@ -4082,7 +4084,9 @@ bound=(1994-12-01 00:00:00, 1998-12-01 00:00:00)
             )
 
         coords = self._as_list_of_coords(coords)
-        for coord in sorted(coords, key=lambda coord: coord._as_defn()):
+        for coord in sorted(
+            coords, key=lambda coord: coord._as_defn()._sort_key()
+        ):
             if coord.ndim > 1:
                 msg = (
                     "Cannot aggregate_by coord %s as it is "
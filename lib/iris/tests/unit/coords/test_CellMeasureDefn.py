@@ -0,0 +1,39 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+"""Unit tests for the :class:`iris.coords.CellMeasureDefn` class."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from cf_units import Unit
+
+from iris.coords import CellMeasureDefn
+
+
+class Test___hash__(tests.IrisTest):
+    def _defn(self, units="m2", measure="area"):
+        return CellMeasureDefn(
+            "cell_area", None, "areacella", units, {"source": "test"}, measure
+        )
+
+    def test_measure(self):
+        defn = self._defn(measure="area")
+        other = self._defn(measure="area")
+        different = self._defn(measure="volume")
+        self.assertNotEqual(defn, different)
+        self.assertEqual(len({defn, other, different}), 2)
+
+    def test_unit_string(self):
+        defn = self._defn(units="m2")
+        other = self._defn(units=Unit("m2"))
+        self.assertEqual(defn, other)
+        self.assertEqual(hash(defn), hash(other))
+        self.assertEqual(len({defn, other}), 1)
+
+
+if __name__ == "__main__":
+    tests.main()
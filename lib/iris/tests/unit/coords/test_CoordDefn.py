@@ -0,0 +1,76 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+"""Unit tests for the :class:`iris.coords.CoordDefn` class."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from cf_units import Unit
+
+from iris.coord_systems import GeogCS
+from iris.coords import CoordDefn
+
+
+class Test___hash__(tests.IrisTest):
+    def _defn(self, units="degrees", coord_system=None):
+        return CoordDefn(
+            "latitude",
+            None,
+            "lat",
+            units,
+            {"source": "test"},
+            coord_system,
+            False,
+        )
+
+    def test_coord_system_excluded(self):
+        # Coordinate systems are unhashable, but equal ones must still give
+        # equal definitions the same hash.
+        defn = self._defn(coord_system=GeogCS(6371229.0))
+        other = self._defn(coord_system=GeogCS(6371229.0))
+        self.assertEqual(defn, other)
+        self.assertEqual(hash(defn), hash(other))
+        self.assertEqual(len({defn, other}), 1)
+
+    def test_unit_string(self):
+        defn = self._defn(units="degrees")
+        other = self._defn(units=Unit("degrees"))
+        self.assertEqual(defn, other)
+        self.assertEqual(hash(defn), hash(other))
+        self.assertEqual(len({defn, other}), 1)
+
+
+class Test___lt__(tests.IrisTest):
+    def _defn(self, standard_name, long_name):
+        return CoordDefn(standard_name, long_name, None, None, {}, None, False)
+
+    def test_none_first(self):
+        defn = self._defn(None, "x")
+        other = self._defn("latitude", None)
+        self.assertLess(defn, other)
+
+    def test_value_order(self):
+        defn = self._defn("latitude", "x")
+        other = self._defn("longitude", None)
+        self.assertLess(defn, other)
+        self.assertFalse(other < defn)
+
+    def test_sort_key(self):
+        defns = [
+            self._defn("longitude", None),
+            self._defn(None, "x"),
+            self._defn("latitude", "x"),
+        ]
+        self.assertEqual(sorted(defns, key=CoordDefn._sort_key), sorted(defns))
+
+    def test_not_implemented(self):
+        defn = self._defn("latitude", None)
+        self.assertIs(defn.__lt__(None), NotImplemented)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -0,0 +1,39 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+"""Unit tests for the :class:`iris.coords._DMDefn` class."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from cf_units import Unit
+
+from iris.coords import _DMDefn
+
+
+class Test___hash__(tests.IrisTest):
+    def _defn(self, units="m", attributes=None):
+        if attributes is None:
+            attributes = {"source": "test"}
+        return _DMDefn("height", None, "height", units, attributes)
+
+    def test_attributes_excluded(self):
+        defn = self._defn()
+        other = self._defn(attributes={"source": "test"})
+        different = self._defn(attributes={"source": "other"})
+        self.assertEqual(hash(defn), hash(different))
+        self.assertEqual(len({defn, other, different}), 2)
+
+    def test_unit_string(self):
+        defn = self._defn(units="m")
+        other = self._defn(units=Unit("m"))
+        self.assertEqual(defn, other)
+        self.assertEqual(hash(defn), hash(other))
+        self.assertEqual(len({defn, other}), 1)
+
+
+if __name__ == "__main__":
+    tests.main()
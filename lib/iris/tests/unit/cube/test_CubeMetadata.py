@@ -0,0 +1,43 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+"""Unit tests for the :class:`iris.cube.CubeMetadata` class."""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+from cf_units import Unit
+
+from iris.coords import CellMethod
+from iris.cube import CubeMetadata
+
+
+class Test___hash__(tests.IrisTest):
+    def _metadata(self, units="K", method="mean"):
+        cell_methods = (CellMethod(method, coords="time"),)
+        return CubeMetadata(
+            "air_temperature", None, "tas", units, {}, cell_methods
+        )
+
+    def test_cell_methods_excluded(self):
+        metadata = self._metadata(method="mean")
+        other = self._metadata(method="mean")
+        different = self._metadata(method="maximum")
+        self.assertEqual(metadata, other)
+        self.assertNotEqual(metadata, different)
+        self.assertEqual(hash(metadata), hash(different))
+        self.assertEqual(len({metadata, other, different}), 2)
+
+    def test_unit_string(self):
+        metadata = self._metadata(units="K")
+        other = self._metadata(units=Unit("K"))
+        self.assertEqual(metadata, other)
+        self.assertEqual(hash(metadata), hash(other))
+        self.assertEqual(len({metadata, other}), 1)
+
+
+if __name__ == "__main__":
+    tests.main()
@@ -58,6 +58,10 @@ class Test_token(tests.IrisTest):
         result = CFVariableMixin.token(token)
         self.assertEqual(result, token)
 
+    def test_fail_empty(self):
+        result = CFVariableMixin.token("")
+        self.assertIsNone(result)
+
 
 class Test_name(tests.IrisTest):
     def setUp(self):
@@ -130,6 +134,44 @@ class Test_name(tests.IrisTest):
         with self.assertRaisesRegex(ValueError, emsg):
             self.cf_var.name(default="_nope", token=True)
 
+    def test_token_override(self):
+        class Upper(CFVariableMixin):
+            @staticmethod
+            def token(name):
+                return name.upper() if name is not None else name
+
+        cf_var = Upper()
+        cf_var.standard_name = None
+        cf_var.long_name = "nope nope"
+        cf_var.var_name = None
+        cf_var.attributes = {}
+        self.assertEqual(cf_var.name(token=True), "NOPE NOPE")
+        self.assertEqual(self.cf_bad.name(token=True), self.default)
+
+    def test_rename_after_name(self):
+        self.cf_var.long_name = "before"
+        self.assertEqual(self.cf_var.name(), "before")
+        self.cf_var.long_name = "after"
+        self.assertEqual(self.cf_var.name(), "after")
+
+    def test_stash_after_name(self):
+        self.assertEqual(self.cf_var.name(), self.default)
+        self.cf_var.attributes["STASH"] = "m01s00i004"
+        self.assertEqual(self.cf_var.name(), "m01s00i004")
+        del self.cf_var.attributes["STASH"]
+        self.assertEqual(self.cf_var.name(), self.default)
+
+    def test_stash_none(self):
+        self.cf_var.attributes["STASH"] = None
+        result = self.cf_var.name()
+        self.assertEqual(result, self.default)
+
+    def test_token_after_name(self):
+        self.assertEqual(self.cf_bad.name(), "nope nope")
+        emsg = "Cannot retrieve a valid name token"
+        with self.assertRaisesRegex(ValueError, emsg):
+            self.cf_bad.name(default="_nope", token=True)
+
 
 class Test_names(tests.IrisTest):
     def setUp(self):
@@ -0,0 +1,57 @@
+# Copyright Iris contributors
+#
+# This file is part of Iris and is released under the LGPL license.
+# See COPYING and COPYING.LESSER in the root of the repository for full
+# licensing details.
+"""
+Unit tests for the :class:`iris._cube_coord_common.LimitedAttributeDict`.
+
+"""
+
+# Import iris.tests first so that some things can be initialised before
+# importing anything else.
+import iris.tests as tests
+
+import numpy as np
+
+from iris._cube_coord_common import LimitedAttributeDict
+
+
+class Test___eq__(tests.IrisTest):
+    def setUp(self):
+        self.values = dict(one=1, two="two", three=np.arange(3))
+        self.attributes = LimitedAttributeDict(self.values)
+
+    def test_equal(self):
+        other = LimitedAttributeDict(self.values)
+        self.assertTrue(self.attributes == other)
+
+    def test_equal_dict(self):
+        self.assertTrue(self.attributes == self.values)
+
+    def test_different_keys(self):
+        other = LimitedAttributeDict(self.values)
+        del other["one"]
+        other["four"] = 1
+        self.assertFalse(self.attributes == other)
+
+    def test_extra_key(self):
+        other = LimitedAttributeDict(self.values, four=4)
+        self.assertFalse(self.attributes == other)
+
+    def test_different_array_values(self):
+        other = LimitedAttributeDict(self.values)
+        other["three"] = np.arange(3) + 1
+        self.assertFalse(self.attributes == other)
+
+
+class Test___setitem__(tests.IrisTest):
+    def test_forbidden(self):
+        attributes = LimitedAttributeDict()
+        emsg = "'units' is not a permitted attribute"
+        with self.assertRaisesRegex(ValueError, emsg):
+            attributes["units"] = "m"
+
+
+if __name__ == "__main__":
+    tests.main()